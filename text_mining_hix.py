@@ -5,7 +5,7 @@ Key improvements over your original script:
 - Robust tokenization (regex, lowercasing, punctuation/whitespace handling, NaN-safe)
 - Exact whole-word matching (case-insensitive) with optional substring matching toggle
 - Dynamic Treeview columns to match the result DataFrame
-- Non-blocking UI feel with a progress/status label (still single-threaded for simplicity)
+- Non-blocking UI: loading and analysis run on a background thread, with a progress/status label
 - Sheet name dropdown auto-populated after selecting a file
 - Safer image handling for word cloud via Pillow (ImageTk)
 - Clear function names (avoid name shadowing like `save_button` function vs widget)
@@ -13,18 +13,45 @@ Key improvements over your original script:
 - Extra Dutch stopwords and configurable list
 
 Dependencies: pandas, openpyxl (for .xlsx), wordcloud, pillow, matplotlib
+Optional: python-calamine (much faster .xlsx parsing with pandas >= 2.2),
+xlsxwriter (constant-memory .xlsx output), pyarrow (.parquet output),
+pyahocorasick (faster substring matching for long keyword lists)
 """
 
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from tkinter import ttk
+import numpy as np
 import pandas as pd
+import os
 import re
+import functools
+import threading
+from collections import Counter
 from io import BytesIO
 from wordcloud import WordCloud
 import matplotlib.pyplot as plt
 from PIL import Image, ImageTk
 
+try:
+    import xlsxwriter  # constant-memory .xlsx writer
+    HAS_XLSXWRITER = True
+except ImportError:
+    HAS_XLSXWRITER = False
+
+try:
+    import ahocorasick  # pyahocorasick, for substring matching with many keywords
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+try:
+    import python_calamine  # noqa: F401  (Rust-based reader, used by pandas >= 2.2 as engine="calamine")
+    # Older pandas does not know the engine at all, so every read would fail
+    HAS_CALAMINE = tuple(int(p) for p in pd.__version__.split(".")[:2]) >= (2, 2)
+except ImportError:
+    HAS_CALAMINE = False
+
 # -----------------------------
 # Configuration / Defaults
 # -----------------------------
@@ -32,104 +59,243 @@ DEFAULT_SHEET_GUESS = "VPK Rapportage"
 DEFAULT_KEYWORDS = ["bradycard", "onrust", "apneu", "pijn", "hoofdpijn"]
 DEFAULT_PATIENT_ID_COL = "patient_id"
 DEFAULT_TEXT_COL = "Report"
+AHOCORASICK_MIN_KEYWORDS = 12  # below this, one str.contains pass per keyword is faster
+WORDCLOUD_MAX_WORDS = 500  # words placed in the cloud; less frequent words are dropped before rendering
 
-DUTCH_STOPWORDS = set(
-    [
+DUTCH_STOPWORDS = frozenset(
+    (
         "de", "het", "en", "een", "in", "van", "met", "op", "te", "dat", "die",
         "is", "was", "bij", "als", "maar", "ook", "niet", "wel", "om", "voor",
         "naar", "uit", "aan", "door", "tot", "over", "onder", "hij", "zij", "ze",
         "hun", "zijn", "haar", "we", "wij", "jij", "je", "u", "ik"
-    ]
+    )
 )
 
 # -----------------------------
 # Text Processing
 # -----------------------------
 
-def tokenize(text: str):
-    """Return a list of lowercase word tokens using regex; NaN-safe."""
-    if not isinstance(text, str):
-        return []
-    # Find sequences of letters/numbers (handles accents due to \w with UNICODE in Python3)
-    tokens = re.findall(r"\w+", text.lower(), flags=re.UNICODE)
-    return tokens
+# Sequences of letters/numbers (handles accents due to \w with UNICODE in Python3)
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+@functools.lru_cache(maxsize=32)
+def _keyword_pattern(keywords):
+    """Compile one whole-word alternation regex for a tuple of lowercase keywords (cached)."""
+    alternation = "|".join(re.escape(kw) for kw in sorted(set(keywords), key=len, reverse=True))
+    return re.compile(rf"\b(?:{alternation})\b")
+
+
+@functools.lru_cache(maxsize=32)
+def _keyword_automaton(keywords):
+    """Build an Aho-Corasick automaton for a tuple of unique lowercase keywords (cached).
+
+    Each keyword maps to its position in `keywords`.
+    """
+    automaton = ahocorasick.Automaton()
+    for i, kw in enumerate(keywords):
+        automaton.add_word(kw, i)
+    automaton.make_automaton()
+    return automaton
+
+
+def _keyword_matrix(series, kws, use_substring=False):
+    """Return an int8 (rows x keywords) presence matrix for a Series of lowercased texts.
+
+    Whole-word keywords that overlap (one inside another) are all detected:
+
+    >>> texts = pd.Series(["covid-19 positief", "pijn op borst"], dtype=object)
+    >>> _keyword_matrix(texts, ["covid", "covid-19", "pijn op borst", "pijn"]).tolist()
+    [[1, 1, 0, 0], [0, 0, 1, 1]]
+    """
+    mat = np.zeros((len(series), len(kws)), dtype=np.int8)
+    lowered_kws = [kw.lower() for kw in kws]
+    unique_kws = tuple(dict.fromkeys(lowered_kws))
+    if use_substring and HAS_AHOCORASICK and len(unique_kws) >= AHOCORASICK_MIN_KEYWORDS:
+        # substring presence, many keywords: one automaton pass per document finds all
+        # (overlapping) keywords at once, independent of the number of keywords
+        automaton = _keyword_automaton(unique_kws)
+        hit_rows, hit_cols = [], []
+        for row, text in enumerate(series.to_numpy()):
+            for col in {i for _, i in automaton.iter(text)}:
+                hit_rows.append(row)
+                hit_cols.append(col)
+        unique_mat = np.zeros((len(series), len(unique_kws)), dtype=np.int8)
+        unique_mat[hit_rows, hit_cols] = 1
+        mat[:] = unique_mat[:, [unique_kws.index(kw) for kw in lowered_kws]]
+    elif use_substring:
+        # substring presence: kw anywhere inside a token (one pass per keyword so
+        # overlapping keywords like 'pijn'/'hoofdpijn' are all detected)
+        for i, kw in enumerate(lowered_kws):
+            mat[:, i] = series.str.contains(kw, regex=False).to_numpy(dtype=np.int8)
+    elif kws:
+        # whole-word presence only. Most reports mention none of the keywords, so a cheap
+        # substring check on each keyword's first 3 letters picks the candidate rows first
+        prefixes = tuple(dict.fromkeys(kw[:3] for kw in unique_kws))
+        texts = series.to_numpy()
+        candidates = np.fromiter((any(p in t for p in prefixes) for t in texts), dtype=bool, count=len(texts))
+        if all(_TOKEN_RE.fullmatch(kw) for kw in unique_kws):
+            # Single-token keywords each match exactly one whole token, so they cannot
+            # overlap and a single alternation regex scans each candidate document once
+            found = series[candidates].str.findall(_keyword_pattern(unique_kws)).explode().dropna()
+            hit_rows = found.index.to_numpy()
+            hit_words = found.to_numpy()
+            for i, kw in enumerate(lowered_kws):
+                mat[hit_rows[hit_words == kw], i] = 1
+        else:
+            # Multi-token keywords ('covid-19', 'pijn op borst') can contain shorter ones;
+            # an alternation would consume the longer match, so use one pass per keyword
+            candidate_rows = np.flatnonzero(candidates)
+            candidate_texts = series[candidates]
+            for i, kw in enumerate(lowered_kws):
+                hits = candidate_texts.str.contains(_keyword_pattern((kw,)))
+                mat[candidate_rows, i] = hits.to_numpy(dtype=np.int8)
+    return mat
 
 
 def extract_keywords_from_text(text: str, medical_keywords, use_substring=False):
-    """Extract keywords present in `text`.
+    """Extract keywords present in `text`, matched exactly like the results table.
 
     If use_substring is False (default): only whole-word matches are considered.
-    If use_substring is True: keywords are matched as substrings of tokens.
+    If use_substring is True: keywords are matched as substrings of the text.
+    Returns the matched keywords lowercased.
+
+    >>> extract_keywords_from_text("Pijn op borst", ["pijn op borst", "pijn", "apneu"])
+    ['pijn op borst', 'pijn']
     """
-    tokens = tokenize(text)
-    if not tokens:
+    kws = list(dict.fromkeys(kw.strip().lower() for kw in medical_keywords if kw and kw.strip()))
+    if not isinstance(text, str) or not kws:
         return []
+    row = _keyword_matrix(pd.Series([text.lower()], dtype=object), kws, use_substring=use_substring)[0]
+    return [kw for kw, hit in zip(kws, row) if hit]
 
-    # Precompute for quick membership
-    token_set = set(tokens)
-    kws = [kw.strip().lower() for kw in medical_keywords if kw and kw.strip()]
 
-    if not use_substring:
-        # whole-word presence only
-        return [kw for kw in kws if kw in token_set]
-    else:
-        # substring presence: any token containing kw
-        matched = []
-        for kw in kws:
-            for t in token_set:
-                if kw in t:
-                    matched.append(kw)
-                    break
-        return matched
-
-
-def process_sheet(file_path, sheet_name, medical_keywords, patient_id_column, text_column, use_substring=False):
-    # Load data
+def load_sheet(file_path, sheet_name):
+    """Read one sheet of an Excel workbook into a DataFrame."""
     try:
-        df = pd.read_excel(file_path, sheet_name=sheet_name)
+        if HAS_CALAMINE:
+            return pd.read_excel(file_path, sheet_name=sheet_name, engine="calamine")
+        return pd.read_excel(file_path, sheet_name=sheet_name)
     except Exception as e:
         raise ValueError(f"Failed to read sheet '{sheet_name}' from file. Details: {e}")
 
-    missing = [c for c in [patient_id_column, text_column] if c not in df.columns]
+
+def lower_text_column(df, text_column):
+    """Return `text_column` lowercased, with non-text cells as "" and a 0..n-1 index."""
+    # One pass over the raw NumPy values instead of label-aligned map/where/str.lower steps
+    texts = df[text_column].to_numpy(dtype=object)
+    return pd.Series([t.lower() if isinstance(t, str) else "" for t in texts], dtype=object)
+
+
+def _check_columns(df, columns):
+    missing = [c for c in columns if c not in df.columns]
     if missing:
-        raise ValueError(f"Missing required columns: {', '.join(missing)}.\nAvailable columns: {', '.join(df.columns.astype(str))}")
+        raise ValueError(f"Missing required columns: {', '.join(missing)}.\nAvailable columns: {', '.join(str(c) for c in df.columns)}")
+
 
-    kws = [kw.strip() for kw in medical_keywords if kw and kw.strip()]
-    # Build results rows
-    rows = []
-    all_words = []
+def keyword_table(df, medical_keywords, patient_id_column, text_column, use_substring=False, lowered=None):
+    """Return the keyword presence table (patient id + one 0/1 column per keyword).
 
-    for _, r in df.iterrows():
-        pid = r[patient_id_column]
-        text = r[text_column]
-        text = text if isinstance(text, str) else ""
+    `lowered` may be a precomputed lower_text_column(df, text_column) to skip lowercasing.
+    """
+    _check_columns(df, [patient_id_column, text_column])
+
+    kws = list(dict.fromkeys(kw.strip() for kw in medical_keywords if kw and kw.strip()))
+    series = lower_text_column(df, text_column) if lowered is None else lowered
 
-        matched = extract_keywords_from_text(text, kws, use_substring=use_substring)
+    # Keyword presence matrix (rows x keywords)
+    mat = _keyword_matrix(series, kws, use_substring=use_substring)
+    # Flags stay int8 (not int64) all the way to the saved file; this also covers
+    # empty sheets, which still get the patient_id and keyword columns
+    results = pd.DataFrame(mat, columns=kws)
+    results.insert(0, patient_id_column, df[patient_id_column].to_numpy())
+    return results
 
-        row = {patient_id_column: pid}
-        for kw in kws:
-            row[kw] = int(kw in matched)
-        rows.append(row)
 
-        # Words for wordcloud (stopwords removed)
-        tokens = [t for t in tokenize(text) if t not in DUTCH_STOPWORDS]
-        all_words.extend(tokens)
+def word_counts(df, text_column, lowered=None):
+    """Return a Counter of non-stopword tokens in `text_column`, for the word cloud.
+
+    `lowered` may be a precomputed lower_text_column(df, text_column) to skip lowercasing.
+    """
+    _check_columns(df, [text_column])
+    series = lower_text_column(df, text_column) if lowered is None else lowered
 
-    results = pd.DataFrame(rows)
-    if results.empty:
-        # Ensure at least the patient_id column exists
-        results = pd.DataFrame(columns=[patient_id_column] + kws)
+    # Streamed row by row so memory grows with the vocabulary rather than the total
+    # number of tokens; stopwords removed at the end
+    counts = Counter()
+    for text in series.to_numpy():
+        counts.update(_TOKEN_RE.findall(text))
+    for stopword in DUTCH_STOPWORDS:
+        counts.pop(stopword, None)
+    return counts
 
-    return results, all_words
 
+def process_sheet(file_path, sheet_name, medical_keywords, patient_id_column, text_column, use_substring=False):
+    df = load_sheet(file_path, sheet_name)
+    _check_columns(df, [patient_id_column, text_column])
+    lowered = lower_text_column(df, text_column)
+    results = keyword_table(df, medical_keywords, patient_id_column, text_column, use_substring=use_substring, lowered=lowered)
+    return results, word_counts(df, text_column, lowered=lowered)
+
+
+def _write_xlsx_streaming(results, out_path):
+    # constant_memory flushes each row as soon as the next one starts, so rows must be
+    # written strictly in order (pandas' to_excel writes column by column and would lose data)
+    workbook = xlsxwriter.Workbook(
+        out_path,
+        {"constant_memory": True, "nan_inf_to_errors": True, "default_date_format": "yyyy-mm-dd hh:mm:ss"},
+    )
+    try:
+        sheet = workbook.add_worksheet()
+        # Same header style as pandas' to_excel
+        header_format = workbook.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+        sheet.write_row(0, 0, [str(c) for c in results.columns], header_format)
+        for r, values in enumerate(results.itertuples(index=False, name=None), start=1):
+            sheet.write_row(r, 0, [None if pd.isna(v) else v for v in values])
+    finally:
+        workbook.close()
+
+
+def save_results(results, out_path):
+    """Save the keyword table as .xlsx/.xlsm or .parquet, depending on the file extension."""
+    ext = os.path.splitext(str(out_path))[1].lower()
+    if ext not in (".xlsx", ".xlsm", ".parquet"):
+        raise ValueError(f"Unsupported output file type '{ext or out_path}'. Please use .xlsx or .parquet.")
+
+    if ext == ".parquet":
+        # Excel exports often mix numbers and text in one column (e.g. patient ids), which
+        # Parquet cannot store; write such object columns as strings, keeping blanks as nulls
+        results = results.copy()
+        for col in results.columns[results.dtypes == object]:
+            results[col] = results[col].where(results[col].isna(), results[col].astype(str))
+        results.to_parquet(out_path, index=False, compression="snappy")
+    elif ext == ".xlsx" and HAS_XLSXWRITER:
+        # xlsxwriter cannot produce a valid .xlsm without a VBA project; those go via to_excel
+        _write_xlsx_streaming(results, out_path)
+    else:
+        results.to_excel(out_path, index=False)
 
-def build_wordcloud_image(all_words):
-    text = " ".join(all_words)
-    if not text.strip():
+
+def make_wordcloud():
+    """Create the WordCloud renderer used by the app (reusable across calls)."""
+    return WordCloud(width=800, height=800, background_color="white", colormap="Dark2", max_words=WORDCLOUD_MAX_WORDS)
+
+
+def build_wordcloud_image(word_counts, wc=None):
+    """Render a Counter of words to a PIL image, reusing `wc` (see make_wordcloud) if given."""
+    if wc is None:
+        wc = make_wordcloud()
+
+    # Pass frequencies directly instead of a joined string for WordCloud to re-tokenize;
+    # like WordCloud's own tokenizer, skip numbers and 1-character tokens
+    counter = Counter({w: n for w, n in word_counts.items() if len(w) > 1 and not w.isdigit()})
+    if not counter:
         raise ValueError("No words available to generate a word cloud.")
 
-    wc = WordCloud(width=800, height=800, background_color="white", colormap="Dark2", max_words=500)
-    image = wc.generate(text).to_image()
+    # Only the top max_words can be placed anyway, so the renderer never sees the long
+    # tail of the vocabulary (this also bounds the preview cost on huge corpora)
+    frequencies = dict(counter.most_common(wc.max_words))
+    image = wc.generate_from_frequencies(frequencies).to_image()
     return image
 
 
@@ -146,6 +312,9 @@ class HiXComplicationMinerApp:
         self._set_defaults()
         self.data_results = None  # pandas DataFrame
         self.wordcloud_imgtk = None  # keep a reference
+        # Most recently loaded sheet only: (file_path, mtime, sheet_name) -> (DataFrame, {text column: lowercased text})
+        self._df_cache = {}
+        self._wc = make_wordcloud()  # reused for every word cloud
 
     def _build_ui(self):
         main = ttk.Frame(self.root, padding=10)
@@ -183,14 +352,16 @@ class HiXComplicationMinerApp:
         ttk.Checkbutton(main, text="Allow substring matches (e.g., 'pijn' in 'pijnstilling')", variable=self.var_substring).grid(row=4, column=2, sticky="w", padx=4, pady=4)
 
         # Output row
-        ttk.Label(main, text="Output .xlsx:").grid(row=5, column=0, sticky="w", padx=4, pady=4)
+        ttk.Label(main, text="Output .xlsx/.parquet:").grid(row=5, column=0, sticky="w", padx=4, pady=4)
         self.ent_out = ttk.Entry(main, width=50)
         self.ent_out.grid(row=5, column=1, sticky="we", padx=4, pady=4)
         ttk.Button(main, text="Choose…", command=self.on_choose_output).grid(row=5, column=2, padx=4, pady=4)
 
         # Action buttons
-        ttk.Button(main, text="Extract Keywords", command=self.on_extract).grid(row=6, column=0, padx=4, pady=8, sticky="we")
-        ttk.Button(main, text="Generate Word Cloud", command=self.on_wordcloud).grid(row=6, column=1, padx=4, pady=8, sticky="we")
+        self.btn_extract = ttk.Button(main, text="Extract Keywords", command=self.on_extract)
+        self.btn_extract.grid(row=6, column=0, padx=4, pady=8, sticky="we")
+        self.btn_wordcloud = ttk.Button(main, text="Generate Word Cloud", command=self.on_wordcloud)
+        self.btn_wordcloud.grid(row=6, column=1, padx=4, pady=8, sticky="we")
 
         # Status
         self.lbl_status = ttk.Label(main, text="Ready", foreground="#444")
@@ -247,7 +418,7 @@ class HiXComplicationMinerApp:
             messagebox.showerror("Error reading workbook", str(e))
 
     def on_choose_output(self):
-        path = filedialog.asksaveasfilename(defaultextension=".xlsx", filetypes=[("Excel", "*.xlsx")])
+        path = filedialog.asksaveasfilename(defaultextension=".xlsx", filetypes=[("Excel", "*.xlsx"), ("Parquet", "*.parquet")])
         if path:
             self.ent_out.delete(0, tk.END)
             self.ent_out.insert(0, path)
@@ -276,24 +447,26 @@ class HiXComplicationMinerApp:
             if not messagebox.askyesno("No keywords", "You didn't provide any keywords. Continue anyway?"):
                 return
 
-        try:
-            self._set_status("Processing…")
-            results, _ = process_sheet(file_path, sheet, kws, pid_col, txt_col, use_substring=use_sub)
-            self.data_results = results
-            self._populate_tree(results)
+        out = self.ent_out.get().strip()
 
+        def work():
+            df, lowered = self._load_sheet(file_path, sheet, txt_col)
+            results = keyword_table(df, kws, pid_col, txt_col, use_substring=use_sub, lowered=lowered)
+            # Show the table right away, even if saving below fails
+            self.root.after(0, self._show_results, results)
             # Save if output path provided
-            out = self.ent_out.get().strip()
             if out:
-                results.to_excel(out, index=False)
+                save_results(results, out)
+
+        def done(_):
+            if out:
                 self._set_status(f"Done. Saved to {out}")
                 messagebox.showinfo("Success", f"Keywords extracted and saved to:\n{out}")
             else:
                 self._set_status("Done.")
                 messagebox.showinfo("Success", "Keywords extracted.")
-        except Exception as e:
-            self._set_status("Error")
-            messagebox.showerror("Error", str(e))
+
+        self._run_in_background("Processing…", work, done)
 
     def on_wordcloud(self):
         file_path, sheet, pid_col, txt_col, kws, use_sub = self._read_inputs()
@@ -303,33 +476,98 @@ class HiXComplicationMinerApp:
         if not sheet:
             messagebox.showerror("Missing sheet", "Please select a sheet.")
             return
-        try:
-            self._set_status("Building word cloud…")
-            _, all_words = process_sheet(file_path, sheet, kws, pid_col, txt_col, use_substring=use_sub)
-            img = build_wordcloud_image(all_words)
+
+        def work():
+            df, lowered = self._load_sheet(file_path, sheet, txt_col)
+            counts = word_counts(df, txt_col, lowered=lowered)
+            return build_wordcloud_image(counts, wc=self._wc)
+
+        def done(img):
+            # PhotoImage must be created on the Tk thread
             self.wordcloud_imgtk = ImageTk.PhotoImage(img)
             self.lbl_wc.configure(image=self.wordcloud_imgtk)
             self._set_status("Word cloud ready.")
+
+        self._run_in_background("Building word cloud…", work, done)
+
+    def _run_in_background(self, status, work, on_done):
+        """Run `work()` on a worker thread, then `on_done(result)` back on the Tk thread.
+
+        The action buttons are disabled meanwhile so only one job runs at a time.
+        """
+        self._set_busy(True)
+        self._set_status(status)
+
+        def runner():
+            try:
+                result = work()
+            except Exception as e:
+                self.root.after(0, self._finish_background, None, None, e)
+            else:
+                self.root.after(0, self._finish_background, on_done, result, None)
+
+        threading.Thread(target=runner, daemon=True).start()
+
+    def _finish_background(self, on_done, result, error):
+        self._set_busy(False)
+        try:
+            if error is not None:
+                raise error
+            on_done(result)
         except Exception as e:
             self._set_status("Error")
             messagebox.showerror("Error", str(e))
 
+    def _set_busy(self, busy: bool):
+        state = ["disabled"] if busy else ["!disabled"]
+        self.btn_extract.state(state)
+        self.btn_wordcloud.state(state)
+
+    def _show_results(self, results: pd.DataFrame):
+        self.data_results = results
+        self._populate_tree(results)
+
+    def _load_sheet(self, file_path, sheet_name, text_column):
+        """Return (DataFrame, lowercased text column), reusing cached copies while the file is unchanged.
+
+        The lowercased text is None if `text_column` does not exist; keyword_table() and word_counts() report that.
+        """
+        try:
+            mtime = os.path.getmtime(file_path)
+        except OSError:
+            mtime = None
+        key = (file_path, mtime, sheet_name)
+        entry = self._df_cache.get(key)
+        if entry is None:
+            # Release the previous sheet before loading so large exports are never held twice
+            self._df_cache = {}
+            entry = (load_sheet(file_path, sheet_name), {})
+            self._df_cache = {key: entry}
+
+        df, lowered_by_column = entry
+        if text_column in df.columns and text_column not in lowered_by_column:
+            lowered_by_column[text_column] = lower_text_column(df, text_column)
+        return df, lowered_by_column.get(text_column)
+
     def _populate_tree(self, df: pd.DataFrame):
         # Clear old columns/items
         for col in self.tree["columns"]:
             self.tree.heading(col, text="")
         self.tree.delete(*self.tree.get_children())
 
-        cols = list(df.columns.astype(str))
+        cols = [str(c) for c in df.columns]
         self.tree["columns"] = cols
         for c in cols:
             self.tree.heading(c, text=c)
             self.tree.column(c, width=120, anchor="center")
 
-        # Insert rows
-        for _, row in df.iterrows():
-            values = [row[c] for c in cols]
-            self.tree.insert("", "end", values=values)
+        # Insert rows; hide the tree meanwhile so Tk does not redraw after every insert
+        self.tree.grid_remove()
+        try:
+            for values in df.itertuples(index=False, name=None):
+                self.tree.insert("", "end", values=values)
+        finally:
+            self.tree.grid()
 
     def _set_status(self, text: str):
         self.lbl_status.configure(text=text)